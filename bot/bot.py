@@ -7,8 +7,15 @@ from .config import Config
 
 
 async def on_startup() -> None:
-    prisma = Prisma(auto_register=True)
-    await prisma.connect()
+    # the client may be started more than once over the lifetime of the
+    # process, re-use the already registered Prisma client if there is one
+    try:
+        prisma = get_prisma()
+    except ClientNotRegisteredError:
+        prisma = Prisma(auto_register=True)
+
+    if not prisma.is_connected():
+        await prisma.connect()
 
 
 async def on_shutdown() -> None: